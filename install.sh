@@ -400,7 +400,9 @@ uninstall_transh() {
             print_info "Removing configuration files..."
             rm -rf "${user_home}/.transh_config.json" \
                    "${user_home}/.transh_cache" \
-                   "${user_home}/.transh_lang.json" 2>/dev/null || true
+                   "${user_home}/.transh_cache.db" \
+                   "${user_home}/.transh_lang.json" \
+                   "${user_home}/.transh_lang_src.json" 2>/dev/null || true
             print_success "Configuration files removed"
         fi
     else
@@ -6,13 +6,38 @@ Usage: transh [options] "command"
 
 import os
 import sys
-import subprocess
 import json
-import hashlib
+import argparse
 import signal
+import stat
+import time
 from pathlib import Path
-from typing import Optional, Dict
-import requests
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
+# Heavier modules (requests, subprocess, hashlib, sqlite3, ...) are imported
+# where they are used, so -h and --vi-env start without paying for them.
+if TYPE_CHECKING:
+    import sqlite3
+    import requests
+
+# Prefer orjson for speed, fall back to the standard library.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same.
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent: bool = True) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode('utf-8')
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj, indent: bool = True) -> str:
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2)
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
 
 
 # Handle Ctrl+C gracefully
@@ -33,8 +58,21 @@ DEFAULT_CONFIG = {
 }
 
 CONFIG_FILE = Path.home() / ".transh_config.json"
-CACHE_DIR = Path.home() / ".transh_cache"
+CACHE_DB_FILE = Path.home() / ".transh_cache.db"
 LANG_FILE = Path.home() / ".transh_lang.json"
+LANG_SRC_FILE = Path.home() / ".transh_lang_src.json"
+
+# Maximum size of each chunk when translating long texts in parallel
+PARALLEL_CHUNK_SIZE = 4096
+
+# Translations at least this many bytes are zstd-compressed in the cache
+CACHE_COMPRESS_MIN_SIZE = 4096
+
+# Texts shorter than this are translated without streaming
+STREAM_MIN_LENGTH = 512
+
+# Maximum delay (seconds) before buffered streaming output is flushed
+STREAM_FLUSH_INTERVAL = 0.03
 
 # Built-in UI texts (English)
 UI_TEXTS_EN = {
@@ -77,58 +115,125 @@ UI_TEXTS_EN = {
     "require_files": "Error: -f requires input and output file arguments"
 }
 
+# UI_TEXTS_EN never changes, so its JSON prompt form is encoded once
+UI_TEXTS_EN_JSON = json_dumps(UI_TEXTS_EN)
+
+
+# Lazily opened translation cache database
+_CACHE_DB = None
+
+# Translations found in (or saved to) the cache during this process,
+# keyed by (text hash, target language)
+_CACHE_HITS = {}
+
+
+def text_hash(text: str) -> str:
+    """Hash text to its cache key."""
+    import hashlib
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def get_cache_db() -> "sqlite3.Connection":
+    """Open the cache database, creating its table on first use."""
+    global _CACHE_DB
+    if _CACHE_DB is None:
+        import sqlite3
+        db = sqlite3.connect(str(CACHE_DB_FILE))
+        db.execute("CREATE TABLE IF NOT EXISTS tr (h TEXT, lang TEXT, tr TEXT, PRIMARY KEY (h, lang))")
+        _CACHE_DB = db
+    return _CACHE_DB
 
-def get_cache_path(text: str) -> Path:
-    """Generate cache file path based on text hash."""
+
+def compress_translation(translation: str):
+    """Compress a large translation with zstd if available, else keep it as text."""
+    data = translation.encode('utf-8')
+    if len(data) < CACHE_COMPRESS_MIN_SIZE:
+        return translation
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        print(f"Warning: Failed to create cache directory: {e}")
-    text_hash = hashlib.md5(text.encode()).hexdigest()
-    return CACHE_DIR / f"{text_hash}.json"
+        import zstandard
+    except ImportError:
+        return translation
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def decompress_translation(value) -> Optional[str]:
+    """Inverse of compress_translation; None if zstd data cannot be read."""
+    if not isinstance(value, bytes):
+        return value
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard.ZstdDecompressor().decompress(value).decode('utf-8')
 
 
-def load_cache(text: str, target_lang: str) -> Optional[str]:
-    """Load translation from cache if exists."""
+def load_cache_by_hash(text_digest: str, target_lang: str) -> Optional[str]:
+    """Load translation from cache by text hash; hits are memoized per process."""
+    key = (text_digest, target_lang)
+    if key in _CACHE_HITS:
+        return _CACHE_HITS[key]
     try:
-        cache_file = get_cache_path(text)
-        if cache_file.exists():
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                if cache_data.get("target_language") == target_lang:
-                    return cache_data.get("translation")
+        row = get_cache_db().execute(
+            "SELECT tr FROM tr WHERE h = ? AND lang = ?", key
+        ).fetchone()
+        translation = decompress_translation(row[0]) if row else None
     except Exception:
-        pass
-    return None
+        # Misses and errors (e.g. a locked database) are retried next time
+        return None
+    if translation is not None:
+        _CACHE_HITS[key] = translation
+    return translation
 
 
-def save_cache(text: str, translation: str, target_lang: str):
+def save_cache(text: str, translation: str, target_lang: str, text_digest: Optional[str] = None):
     """Save translation to cache."""
+    key = (text_digest or text_hash(text), target_lang)
     try:
-        cache_file = get_cache_path(text)
-        cache_data = {
-            "summary": text[:200] + ("..." if len(text) > 200 else ""),
-            "target_language": target_lang,
-            "translation": translation
-        }
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
+        db = get_cache_db()
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO tr (h, lang, tr) VALUES (?, ?, ?)",
+                (*key, compress_translation(translation))
+            )
+        _CACHE_HITS[key] = translation
     except Exception as e:
         # Silently ignore cache save errors
         pass
 
 
+def write_file_atomic(path: Path, content: str, mode: int = 0o666):
+    """Write text to a temporary file and move it over path in one step.
+    
+    Symlinks are followed, and an existing target keeps its permissions;
+    a new file is created with mode (subject to the umask).
+    """
+    path = Path(os.path.realpath(path))
+    tmp_path = path.with_name(path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        if path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
 def load_config() -> Optional[Dict]:
     """Load configuration from file."""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                # Ensure all default keys exist
-                for key, value in DEFAULT_CONFIG.items():
-                    if key not in config:
-                        config[key] = value
-                return config
+            config = json_loads(CONFIG_FILE.read_bytes())
+            # Ensure all default keys exist
+            for key, value in DEFAULT_CONFIG.items():
+                if key not in config:
+                    config[key] = value
+            return config
         except Exception as e:
             print(f"Warning: Failed to load config: {e}")
             return None
@@ -140,38 +245,74 @@ def save_config(config: Dict):
     try:
         # Ensure config directory exists
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+        # The config holds the API key, so keep it private to the user
+        write_file_atomic(CONFIG_FILE, json_dumps(config), mode=0o600)
     except Exception as e:
         print(f"Error: Failed to save config: {e}")
         sys.exit(1)
 
 
+def load_translated_ui_texts() -> Dict[str, str]:
+    """Load translated UI texts as stored, without English defaults."""
+    if LANG_FILE.exists():
+        try:
+            return json_loads(LANG_FILE.read_bytes())
+        except Exception:
+            pass
+    return {}
+
+
+# UI texts loaded by load_ui_texts, reused for the rest of the process
+_UI_TEXTS = None
+
+
 def load_ui_texts() -> Dict[str, str]:
     """Load UI texts in target language."""
-    if LANG_FILE.exists():
+    global _UI_TEXTS
+    if _UI_TEXTS is None:
+        # Merge with default to ensure all keys exist
+        _UI_TEXTS = UI_TEXTS_EN.copy()
+        _UI_TEXTS.update(load_translated_ui_texts())
+    return _UI_TEXTS
+
+
+def load_ui_sources() -> Dict:
+    """Load source hashes of the translated UI texts."""
+    if LANG_SRC_FILE.exists():
         try:
-            with open(LANG_FILE, 'r', encoding='utf-8') as f:
-                loaded = json.load(f)
-                # Merge with default to ensure all keys exist
-                result = UI_TEXTS_EN.copy()
-                result.update(loaded)
-                return result
+            return json_loads(LANG_SRC_FILE.read_bytes())
         except Exception:
             pass
-    return UI_TEXTS_EN.copy()
+    return {}
 
 
-def save_ui_texts(texts: Dict[str, str]):
-    """Save translated UI texts."""
+def save_ui_texts(texts: Dict[str, str], target_lang: Optional[str] = None):
+    """Save translated UI texts (and their source hashes if target_lang is given)."""
+    global _UI_TEXTS
+    _UI_TEXTS = None
     try:
         LANG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LANG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(texts, f, ensure_ascii=False, indent=2)
+        write_file_atomic(LANG_FILE, json_dumps(texts))
+        if target_lang:
+            sources = {
+                "target_language": target_lang,
+                "hashes": {key: text_hash(UI_TEXTS_EN[key]) for key in texts if key in UI_TEXTS_EN}
+            }
+            # Only read back by transh, so no indentation
+            write_file_atomic(LANG_SRC_FILE, json_dumps(sources, indent=False))
     except Exception as e:
         print(f"Warning: Failed to save language file: {e}")
 
 
+def remove_ui_texts():
+    """Remove translated UI texts, falling back to English."""
+    global _UI_TEXTS
+    _UI_TEXTS = None
+    for path in (LANG_FILE, LANG_SRC_FILE):
+        if path.exists():
+            path.unlink()
+
+
 def interactive_config():
     """Interactive configuration setup."""
     ui = load_ui_texts()
@@ -210,21 +351,20 @@ def interactive_config():
     if config['target_language'].lower() != "english":
         translating_text = ui.get('translating_ui', 'Translating UI texts to')
         print(f"\n{translating_text} {config['target_language']}...")
-        translated_texts = translate_ui_texts(config)
+        translated_texts = translate_ui_texts_incremental(config, load_translated_ui_texts())
         if translated_texts:
-            save_ui_texts(translated_texts)
+            save_ui_texts(translated_texts, config['target_language'])
             print(ui.get("language_changed", "✓ Language changed and UI texts translated!"))
     else:
         # Remove custom language file if English
-        if LANG_FILE.exists():
-            LANG_FILE.unlink()
+        remove_ui_texts()
     
     return config
 
 
-def translate_ui_texts(config: Dict) -> Optional[Dict[str, str]]:
-    """Translate built-in UI texts to target language."""
-    ui_json = json.dumps(UI_TEXTS_EN, ensure_ascii=False, indent=2)
+def translate_ui_texts(config: Dict, texts: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+    """Translate built-in UI texts (or the given subset) to target language."""
+    ui_json = UI_TEXTS_EN_JSON if texts is None else json_dumps(texts)
     prompt = f"""Translate the following JSON values to {config['target_language']}. 
 Rules:
 1. Keep all keys in English unchanged
@@ -244,13 +384,35 @@ Rules:
                 lines = clean_translation.split('\n')
                 clean_translation = '\n'.join(lines[1:-1]) if len(lines) > 2 else clean_translation
             
-            return json.loads(clean_translation)
+            return json_loads(clean_translation)
         except json.JSONDecodeError as e:
             print(f"JSON parse error: {e}")
             print(f"Response: {translation[:200]}...")
     return None
 
 
+def translate_ui_texts_incremental(config: Dict, existing: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """Translate only UI texts that are missing or whose English source changed."""
+    target_lang = config['target_language']
+    sources = load_ui_sources()
+    hashes = sources.get("hashes", {}) if sources.get("target_language") == target_lang else {}
+    
+    missing = {
+        key: value for key, value in UI_TEXTS_EN.items()
+        if key not in existing or hashes.get(key) != text_hash(value)
+    }
+    
+    result = {key: value for key, value in existing.items() if key in UI_TEXTS_EN and key not in missing}
+    if missing:
+        # Send the pre-encoded full set when nothing can be reused
+        translated = translate_ui_texts(config, None if len(missing) == len(UI_TEXTS_EN) else missing)
+        # The model may return valid JSON that is not an object
+        if not isinstance(translated, dict):
+            return None
+        result.update({key: value for key, value in translated.items() if key in missing})
+    return result
+
+
 def change_language(new_lang: Optional[str] = None):
     """Change target language and retranslate UI texts."""
     config = load_config()
@@ -285,9 +447,9 @@ def change_language(new_lang: Optional[str] = None):
         if new_lang.lower() != "english":
             translating_text = ui.get('translating_ui', 'Translating UI texts to')
             print(f"\n{translating_text} {new_lang}...")
-            translated_texts = translate_ui_texts(config)
+            translated_texts = translate_ui_texts_incremental(config, load_translated_ui_texts())
             if translated_texts:
-                save_ui_texts(translated_texts)
+                save_ui_texts(translated_texts, new_lang)
                 print(ui.get("language_changed", "✓ Language changed and UI texts translated!"))
             else:
                 # If translation fails, keep old language
@@ -296,8 +458,7 @@ def change_language(new_lang: Optional[str] = None):
                 print(ui.get("translation_failed", "Failed to translate UI texts. Language not changed."))
         else:
             # Remove custom language file if switching back to English
-            if LANG_FILE.exists():
-                LANG_FILE.unlink()
+            remove_ui_texts()
             print("✓ Language changed to English!")
 
 
@@ -316,51 +477,149 @@ def view_config():
     print(f"API Key: {'*' * 8 if config['api_key'] else 'not set'}")
     print(f"Target Language: {config['target_language']}")
     print(f"Streaming: {'Enabled' if config.get('stream', False) else 'Disabled'}")
-    print(f"Cache Directory: {CACHE_DIR}")
+    print(f"Cache Database: {CACHE_DB_FILE}")
     print(f"Config File: {CONFIG_FILE}")
     print(f"Language File: {LANG_FILE}")
     print("=" * 30)
 
 
-def run_command(cmd: str) -> str:
-    """Execute shell command and return combined output."""
+def write_output(text: str):
+    """Write a (possibly large) block of text to stdout in a single encoded write."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(text)
+        return
+    # Flush pending text output first to keep ordering
+    sys.stdout.flush()
+    buffer.write(text.encode('utf-8'))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def run_command(cmd: str) -> Tuple[str, Optional[str]]:
+    """Execute shell command and return combined output and its cache hash.
+    
+    Output is read incrementally and hashed as it arrives, so the text does
+    not need to be hashed again for the cache lookup. Line endings are
+    normalized to "\\n" like text mode did, before hashing, so for valid
+    UTF-8 output the digest matches text_hash() of the returned text.
+    """
+    import hashlib
+    import subprocess
     try:
-        result = subprocess.run(
+        digest = hashlib.blake2b(digest_size=16)
+        buf = bytearray()
+        with subprocess.Popen(
             cmd,
             shell=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace"
-        )
-        output = result.stdout
-        if result.stderr:
-            output += "\n" + result.stderr
-        if not output:
-            output = f"Command exited with code {result.returncode} (no output)"
-        return output
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1024 * 1024
+        ) as process:
+            try:
+                pending = b""
+                while chunk := process.stdout.read(65536):
+                    chunk = pending + chunk
+                    # Hold back a trailing \r in case the next chunk starts with \n
+                    pending = b"\r" if chunk.endswith(b"\r") else b""
+                    chunk = chunk[:len(chunk) - len(pending)].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                    digest.update(chunk)
+                    buf.extend(chunk)
+                if pending:
+                    digest.update(b"\n")
+                    buf.extend(b"\n")
+            except BaseException:
+                # Like subprocess.run: don't leave the child running
+                process.kill()
+                raise
+            returncode = process.wait()
+        if not buf:
+            return f"Command exited with code {returncode} (no output)", None
+        return buf.decode('utf-8', 'replace'), digest.hexdigest()
     except Exception as e:
-        return f"Error executing command: {e}"
+        return f"Error executing command: {e}", None
+
+
+# Shared HTTP session so repeated API calls reuse the TLS connection
+_SESSION = None
+
+
+def get_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # Retry connection failures and gateway errors only: a read error or
+        # timeout means the (billable) completion may already be running
+        retry = Retry(
+            total=2,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"})
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+        _SESSION = requests.Session()
+        # Plain http is common for local OpenAI-compatible servers
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
+# (session, url, headers) per (base_url, api_key), built by get_api_client
+_CLIENT_CACHE = {}
+
+
+def get_api_client(config: Dict) -> Tuple["requests.Session", str, Dict[str, str]]:
+    """Return the session, endpoint URL and headers for config, built once per endpoint/key."""
+    key = (config['base_url'], config['api_key'])
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        url = f"{config['base_url'].rstrip('/')}/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {config['api_key']}",
+            "Content-Type": "application/json"
+        }
+        client = _CLIENT_CACHE[key] = (get_session(), url, headers)
+    return client
+
+
+def iter_stream_lines(response, chunk_size: int = 65536):
+    """Yield raw (undecoded) lines of a streaming response."""
+    # SSE responses are chunk-encoded, so each read returns as soon as a
+    # chunk arrives; the large chunk size only cuts down on small reads.
+    buf = b""
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        # One split per chunk; the last piece is an incomplete line
+        *lines, buf = (buf + chunk).split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+    if buf:
+        yield buf.rstrip(b"\r")
 
 
 def call_ai_api(text: str, config: Dict, is_json: bool = False, force_no_stream: bool = False) -> Optional[str]:
     """Call OpenAI-compatible API for translation."""
+    import requests
+    
     if not config.get('api_key'):
         print("Error: API key not configured. Please run: transh -c")
         return None
     
-    url = f"{config['base_url'].rstrip('/')}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {config['api_key']}",
-        "Content-Type": "application/json"
-    }
+    session, url, headers = get_api_client(config)
     
     system_content = f"You are a translator. Translate the given text into {config['target_language']}. Only output the translation, no explanations."
     if is_json:
         system_content += " Output valid JSON only."
     
     # Force non-streaming for JSON or when explicitly requested
-    use_stream = config.get('stream', True) and not is_json and not force_no_stream
+    wants_stream = config.get('stream', True) and not is_json and not force_no_stream
+    # Short texts come back in one response faster than over SSE
+    use_stream = wants_stream and len(text) >= STREAM_MIN_LENGTH
     
     payload = {
         "model": config['model'],
@@ -372,35 +631,56 @@ def call_ai_api(text: str, config: Dict, is_json: bool = False, force_no_stream:
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60, stream=use_stream)
+        response = session.post(url, headers=headers, json=payload, timeout=60, stream=use_stream)
         response.raise_for_status()
         
         if use_stream:
-            # Handle streaming response
-            full_text = ""
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode('utf-8')
-                    if line.startswith('data: '):
-                        data_str = line[6:]
-                        if data_str == '[DONE]':
-                            break
-                        try:
-                            data = json.loads(data_str)
-                            if 'choices' in data and len(data['choices']) > 0:
-                                delta = data['choices'][0].get('delta', {})
-                                content = delta.get('content', '')
-                                if content:
-                                    print(content, end='', flush=True)
-                                    full_text += content
-                        except json.JSONDecodeError:
-                            continue
-            print()  # New line after streaming
-            return full_text
+            # Handle streaming response, writing bytes and flushing on
+            # newlines or every STREAM_FLUSH_INTERVAL seconds
+            parts = []
+            sys.stdout.flush()
+            out = getattr(sys.stdout, "buffer", None)
+            last_flush = time.monotonic()
+            for line in iter_stream_lines(response):
+                # Lines stay bytes: blank and non-data lines are skipped
+                # without decoding, and the JSON parser takes bytes directly
+                if not line or not line.startswith(b'data: '):
+                    continue
+                data_bytes = line[6:]
+                if data_bytes == b'[DONE]':
+                    break
+                try:
+                    data = json_loads(data_bytes)
+                    if 'choices' in data and len(data['choices']) > 0:
+                        delta = data['choices'][0].get('delta', {})
+                        content = delta.get('content', '')
+                        if content:
+                            parts.append(content)
+                            if out is None:
+                                print(content, end='', flush=True)
+                                continue
+                            out.write(content.encode('utf-8'))
+                            now = time.monotonic()
+                            if '\n' in content or now - last_flush > STREAM_FLUSH_INTERVAL:
+                                out.flush()
+                                last_flush = now
+                except json.JSONDecodeError:
+                    continue
+            # New line after streaming
+            if out is None:
+                print()
+            else:
+                out.write(b"\n")
+                out.flush()
+            return "".join(parts)
         else:
             # Handle non-streaming response
-            data = response.json()
-            return data["choices"][0]["message"]["content"].strip()
+            data = json_loads(response.content)
+            translation = data["choices"][0]["message"]["content"].strip()
+            if wants_stream:
+                # Show it as streaming would have
+                write_output(translation)
+            return translation
             
     except KeyboardInterrupt:
         print("\n\nTranslation interrupted by user.")
@@ -413,8 +693,72 @@ def call_ai_api(text: str, config: Dict, is_json: bool = False, force_no_stream:
         return None
 
 
-def translate_text(text: str, config: Dict, use_cache: bool = True, temp_language: Optional[str] = None) -> Optional[str]:
-    """Translate text with caching support."""
+def split_text_chunks(text: str, max_size: int = PARALLEL_CHUNK_SIZE) -> List[str]:
+    """Split text on paragraph boundaries into chunks of at most max_size chars."""
+    # Empty paragraphs are kept so joining the chunks restores the text
+    chunks = []
+    current = None
+    for paragraph in text.split("\n\n"):
+        if current is not None and len(current) + 2 + len(paragraph) > max_size:
+            chunks.append(current)
+            current = paragraph
+        else:
+            current = paragraph if current is None else f"{current}\n\n{paragraph}"
+    chunks.append(current)
+    return chunks
+
+
+def translate_chunk(chunk: str, config: Dict) -> Optional[str]:
+    """Translate one chunk without streaming, keeping its surrounding whitespace."""
+    body = chunk.strip()
+    if not body:
+        return chunk
+    translation = call_ai_api(body, config, force_no_stream=True)
+    if translation is None:
+        return None
+    start = chunk.index(body)
+    return chunk[:start] + translation + chunk[start + len(body):]
+
+
+def translate_text_parallel(text: str, config: Dict, concurrency: int = 4) -> Optional[str]:
+    """Translate long text as concurrent non-streaming requests, one per chunk.
+    
+    With streaming enabled the joined result is printed once all chunks are done.
+    """
+    chunks = split_text_chunks(text)
+    if len(chunks) == 1:
+        return call_ai_api(text, config)
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Translate identical chunks only once
+    unique = list(dict.fromkeys(chunks))
+    
+    # Create the shared session before worker threads use it
+    get_session()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {chunk: executor.submit(translate_chunk, chunk, config) for chunk in unique}
+        translated = {chunk: future.result() for chunk, future in futures.items()}
+    except (KeyboardInterrupt, SystemExit):
+        # Worker threads are joined at interpreter exit, which would wait for
+        # every in-flight request; cancel pending chunks and leave right away
+        executor.shutdown(wait=False, cancel_futures=True)
+        sys.stdout.flush()
+        os._exit(0)
+    executor.shutdown()
+    if any(translation is None for translation in translated.values()):
+        return None
+    result = "\n\n".join(translated[chunk] for chunk in chunks)
+    if config.get('stream', True):
+        # Show the result as the streaming single-chunk path would
+        write_output(result)
+    return result
+
+
+def translate_text(text: str, config: Dict, use_cache: bool = True, temp_language: Optional[str] = None,
+                   parallel: bool = False, text_digest: Optional[str] = None) -> Optional[str]:
+    """Translate text with caching support (text_digest skips rehashing text)."""
     ui = load_ui_texts()
     
     # Use temporary language if provided, otherwise use config language
@@ -426,21 +770,25 @@ def translate_text(text: str, config: Dict, use_cache: bool = True, temp_languag
         effective_config['target_language'] = temp_language
     
     # Check cache only if not using temporary language and cache is enabled
+    text_digest = text_digest or text_hash(text)
     if use_cache and not temp_language:
-        cached = load_cache(text, target_lang)
+        cached = load_cache_by_hash(text_digest, target_lang)
         if cached:
             print(ui.get("cached", "[Using cached translation]"))
             # Print cached translation
-            print(cached)
+            write_output(cached)
             return cached
     
     # Translate
     print(ui.get("translating", "Translating to {}...").format(target_lang))
-    translation = call_ai_api(text, effective_config)
+    if parallel:
+        translation = translate_text_parallel(text, effective_config)
+    else:
+        translation = call_ai_api(text, effective_config)
     
     # Save to cache only if not using temporary language
     if translation and not temp_language:
-        save_cache(text, translation, target_lang)
+        save_cache(text, translation, target_lang, text_digest)
     
     return translation
 
@@ -455,45 +803,83 @@ def show_help():
     print(ui.get("examples", UI_TEXTS_EN["examples"]))
 
 
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (help is rendered by show_help)."""
+    parser = argparse.ArgumentParser(prog="transh", add_help=False, allow_abbrev=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("-c", action="store_true")
+    parser.add_argument("--vi-env", action="store_true")
+    parser.add_argument("-t", nargs="?", const="")
+    parser.add_argument("-f", nargs="*")
+    parser.add_argument("-l", nargs="?", const="")
+    parser.add_argument("-r", action="store_true")
+    parser.add_argument("command", nargs="?")
+    return parser
+
+
+def is_clustered_option(arg: str) -> bool:
+    """Whether argparse would read arg as clustered short options (e.g. "-la" as "-l a")."""
+    if len(arg) <= 2 or not arg.startswith("-") or arg.startswith("--") or " " in arg:
+        return False
+    # Negative numbers are positionals for argparse
+    return not arg[1:].replace(".", "", 1).isdigit()
+
+
+def attach_text_argument(argv: List[str]) -> List[str]:
+    """Pass the token after -t as its value even if it starts with a dash."""
+    result = []
+    i = 0
+    while i < len(argv):
+        if argv[i] == "-t" and i + 1 < len(argv):
+            result.append(f"-t={argv[i + 1]}")
+            i += 2
+        else:
+            result.append(argv[i])
+            i += 1
+    return result
+
+
 def main():
     ui = load_ui_texts()
     
-    # Parse arguments
-    if len(sys.argv) < 2 or "-h" in sys.argv or "--help" in sys.argv:
+    # Parse arguments; anything left over (extra positionals, unknown or
+    # clustered options) is reported instead of silently dropped
+    argv = attach_text_argument(sys.argv[1:])
+    args, extras = build_arg_parser().parse_known_args(argv)
+    extras += [arg for arg in argv if is_clustered_option(arg) and not arg.startswith("-t=")]
+    # -t and -f take no command, and -f takes exactly two files
+    if (args.t is not None or args.f is not None) and args.command:
+        extras.append(args.command)
+    if args.f is not None and len(args.f) > 2:
+        extras += args.f[2:]
+    if len(sys.argv) < 2 or args.help:
         show_help()
         sys.exit(0)
     
     # Handle special options
-    if "-c" in sys.argv:
+    if args.c:
         interactive_config()
         sys.exit(0)
     
-    if "--vi-env" in sys.argv:
+    if args.vi_env:
         view_config()
         sys.exit(0)
     
+    if extras:
+        if args.t is not None:
+            print(ui.get("require_text", "Error: -t requires a text argument"))
+        elif args.f is not None:
+            print(ui.get("require_files", "Error: -f requires input and output file arguments"))
+        else:
+            print(ui.get("no_command", "Error: No command specified"))
+        show_help()
+        sys.exit(1)
+    
     # Handle -l (change language) - only if it's the ONLY operation
     # Skip if -l is used with -t, -f, or a command (temporary language mode)
-    # Check if there's a command (non-option argument that's not after -l)
-    has_command = False
-    for i, arg in enumerate(sys.argv[1:], 1):
-        # Skip the argument after -l
-        if i > 1 and sys.argv[i-1] == "-l":
-            continue
-        # If it's not an option and not right after an option that takes args
-        if not arg.startswith("-") and (i == 1 or sys.argv[i-1] not in ["-t", "-f", "-l"]):
-            has_command = True
-            break
-    
-    if "-l" in sys.argv and "-t" not in sys.argv and "-f" not in sys.argv and not has_command:
-        idx = sys.argv.index("-l")
-        # Check if next argument exists and is not another option
-        if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith("-"):
-            # Direct language change
-            change_language(sys.argv[idx + 1])
-        else:
-            # Interactive language change
-            change_language()
+    if args.l is not None and args.t is None and args.f is None and not args.command:
+        # Direct language change, or interactive if no language given
+        change_language(args.l or None)
         sys.exit(0)
     
     # Load config
@@ -502,20 +888,15 @@ def main():
         print(ui.get("config_missing", UI_TEXTS_EN["config_missing"]))
         sys.exit(1)
     
-    use_cache = "-r" not in sys.argv
+    use_cache = not args.r
     
-    # Check for temporary language override (-l used with other commands)
-    temp_language = None
-    for i, arg in enumerate(sys.argv):
-        if arg == "-l" and i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith("-"):
-            temp_language = sys.argv[i + 1]
-            break
+    # Temporary language override (-l used with other commands)
+    temp_language = args.l or None
     
     # Handle -t (translate text directly)
-    if "-t" in sys.argv:
-        idx = sys.argv.index("-t")
-        if idx + 1 < len(sys.argv):
-            text = sys.argv[idx + 1]
+    if args.t is not None:
+        if args.t:
+            text = args.t
             translation = translate_text(text, config, use_cache, temp_language)
             if not translation:
                 print(ui.get("translation_failed", "Translation failed."))
@@ -526,20 +907,16 @@ def main():
         sys.exit(0)
     
     # Handle -f (translate file)
-    if "-f" in sys.argv:
-        idx = sys.argv.index("-f")
-        if idx + 1 < len(sys.argv) and idx + 2 < len(sys.argv):
-            output_file = sys.argv[idx + 1]
-            input_file = sys.argv[idx + 2]
+    if args.f is not None:
+        if len(args.f) >= 2:
+            output_file, input_file = args.f[:2]
             
             try:
-                with open(input_file, 'r', encoding='utf-8') as f:
-                    text = f.read()
+                text = Path(input_file).read_text(encoding='utf-8')
                 
-                translation = translate_text(text, config, use_cache, temp_language)
+                translation = translate_text(text, config, use_cache, temp_language, parallel=True)
                 if translation:
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(translation)
+                    Path(output_file).write_text(translation, encoding='utf-8')
                     saved_text = ui.get("translation_saved", "✓ Translation saved to {}")
                     if "{}" in saved_text:
                         print(saved_text.format(output_file))
@@ -568,15 +945,15 @@ def main():
         sys.exit(0)
     
     # Default: translate command output
-    command = sys.argv[-1]
-    if command.startswith("-"):
+    command = args.command
+    if not command:
         print(ui.get("no_command", "Error: No command specified"))
         show_help()
         sys.exit(1)
     
     executing_text = ui.get('executing', 'Executing')
     print(f"{executing_text}: {command}")
-    output = run_command(command)
+    output, output_digest = run_command(command)
     
     output_len_text = ui.get("output_length", "Command output ({} chars)")
     if "{}" in output_len_text:
@@ -584,15 +961,13 @@ def main():
     else:
         print(f"Command output ({len(output)} chars)")
     
-    print("---")
-    print(output)
-    print("---")
+    write_output(f"---\n{output}\n---")
     
     if not output.strip():
         print(ui.get("no_output", "No output to translate."))
         sys.exit(0)
     
-    translation = translate_text(output, config, use_cache, temp_language)
+    translation = translate_text(output, config, use_cache, temp_language, text_digest=output_digest)
     if not translation:
         print(ui.get("translation_failed", "Translation failed."))
         sys.exit(1)